@@ -8,12 +8,171 @@ import os
 import sys
 import subprocess
 import json
-import requests
-from datetime import datetime, timedelta
-import pytz
-from typing import List, Dict, Optional
+import re
+import tempfile
+import importlib
+import string
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+from typing import TYPE_CHECKING, List, Dict, Optional, Iterable, Iterator, Tuple
 import argparse
+import shlex
 import time
+import atexit
+import queue
+import threading
+import asyncio
+import heapq
+from collections import Counter
+from itertools import count, islice
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import fcntl  # File locking for the shared rate limit state; not available on Windows
+except ImportError:
+    fcntl = None
+
+if TYPE_CHECKING:
+    import httpx
+
+# httpx, tenacity and the optional packages below are imported where they are first used,
+# so --help and a scheduled run waiting for 2:30 AM don't pay for loading them:
+#   pygit2    reads the repository in-process instead of shelling out to git
+#   tiktoken  exact prompt token counts when splitting large windows
+#   h2        (httpx[http2]) lets httpx talk HTTP/2 to OpenAI
+
+
+def import_optional(name: str):
+    """Import an optional dependency, or return None if it is not installed."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+# Sets, so checking a file's extension is one hash lookup whatever the bucket size
+KOTLIN_EXTS = frozenset({'.kt'})
+ANDROID_EXTS = frozenset({'.kt', '.xml', '.java', '.gradle'})
+
+# Prompt templates; the parts that only depend on configuration are rendered once per summarizer
+SUMMARY_PROMPT = string.Template(
+    "Analyze these git commits from an Android Kotlin project and provide a CONCISE HIGH-LEVEL WORK SUMMARY.\n\n"
+    "$details\n\n"
+    "$guidelines"
+)
+SYSTEM_PROMPT = string.Template(
+    "You are a developer creating a concise work summary. Generate exactly $bullet_points short, direct bullet "
+    "points about what was accomplished. Be factual and to the point. Avoid promotional language, superlatives, "
+    "and boastful tone. Maximum 20 words per bullet point."
+)
+BATCH_SYSTEM_PROMPT = string.Template(
+    "You are a developer creating concise work summaries for several time windows. For each window, generate "
+    "exactly $bullet_points short, direct bullet points about what was accomplished. Be factual and to the point. "
+    "Avoid promotional language, superlatives, and boastful tone. Maximum 20 words per bullet point."
+)
+
+
+def file_extension(path: str) -> str:
+    """Return the extension of path including the dot, or '' if it has none (like os.path.splitext)."""
+    dot = path.rfind('.')
+    name_start = path.rfind('/') + 1
+    # A dot in a directory name, or among the leading dots of a name ('.gitignore',
+    # '..hidden'), does not start an extension
+    if dot <= name_start or (path[name_start] == '.' and not path[name_start:dot].strip('.')):
+        return ''
+    return path[dot:]
+
+
+class TokenBucket:
+    """Paces OpenAI requests against requests-per-minute and tokens-per-minute limits.
+
+    The bucket state lives in a JSON file guarded by an exclusive file lock, so several
+    summarizer processes (e.g. one per repository) share one budget.
+    """
+
+    STATE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'git_summarizer', 'bucket.json')
+
+    def __init__(self, name: str, requests_per_minute: int, tokens_per_minute: int,
+                 state_file: Optional[str] = None):
+        self.name = name
+        self.max_requests = float(requests_per_minute)
+        self.max_tokens = float(tokens_per_minute)
+        self.refill_rate_requests_per_sec = requests_per_minute / 60.0
+        self.refill_rate_tokens_per_sec = tokens_per_minute / 60.0
+        self.state_file = state_file or self.STATE_FILE
+        self.local_lock = threading.Lock()
+        self.local_state = {}  # Used when the state file is unavailable
+
+    @contextmanager
+    def locked_state(self):
+        """Yield this bucket's refilled state while holding the lock, then persist it."""
+        with self.local_lock:
+            try:
+                os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+                handle = open(self.state_file, 'a+', encoding='utf-8')
+            except OSError:
+                handle = None
+
+            if handle is None:
+                yield self.refill(self.local_state)
+                return
+
+            with handle:
+                if fcntl is not None:
+                    fcntl.flock(handle, fcntl.LOCK_EX)
+                try:
+                    handle.seek(0)
+                    try:
+                        all_states = json.loads(handle.read() or '{}')
+                    except ValueError:
+                        all_states = {}
+
+                    state = self.refill(all_states.setdefault(self.name, {}))
+                    yield state
+
+                    handle.seek(0)
+                    handle.truncate()
+                    json.dump(all_states, handle)
+                    handle.flush()
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def refill(self, state: Dict) -> Dict:
+        """Top up a state dict for the time elapsed since it was last updated."""
+        now = time.time()
+        elapsed = max(0.0, now - state.get('updated', now))
+        state['requests'] = min(self.max_requests,
+                                state.get('requests', self.max_requests) + elapsed * self.refill_rate_requests_per_sec)
+        state['tokens'] = min(self.max_tokens,
+                              state.get('tokens', self.max_tokens) + elapsed * self.refill_rate_tokens_per_sec)
+        state['updated'] = now
+        return state
+
+    def consume(self, tokens: int) -> float:
+        """Block until one request and the given tokens are available, take them, and return the seconds waited."""
+        tokens = min(float(tokens), self.max_tokens)
+        waited = 0.0
+
+        while True:
+            with self.locked_state() as state:
+                if state['requests'] >= 1 and state['tokens'] >= tokens:
+                    state['requests'] -= 1
+                    state['tokens'] -= tokens
+                    return waited
+
+                wait = max((1 - state['requests']) / self.refill_rate_requests_per_sec,
+                           (tokens - state['tokens']) / self.refill_rate_tokens_per_sec,
+                           0.05)
+
+            time.sleep(wait)
+            waited += wait
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: int):
+        """Return over-estimated tokens to the bucket, or take the shortfall, once actual usage is known."""
+        with self.locked_state() as state:
+            state['tokens'] = min(self.max_tokens, state['tokens'] + estimated_tokens - actual_tokens)
+
 
 class GitCommitSummarizer:
     # Configuration variables - easily customizable
@@ -22,45 +181,185 @@ class GitCommitSummarizer:
     MAX_WORDS_PER_BULLET = 20           # CHANGED: Reduced for concise, direct summaries
     AI_MODEL = "gpt-3.5-turbo"       # OpenAI model to use
     MAX_TOKENS = 800                 # Maximum tokens for AI response
+    MAX_COMPLETION_TOKENS = 4096     # Most tokens the model returns for one request (caps windows per batch)
     AI_TEMPERATURE = 0.3             # AI response creativity (0.0-1.0)
-
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize the summarizer with OpenAI API key."""
-        self.api_key = api_key or os.getenv('OPENAI_API_KEY')
-        if not self.api_key:
-            raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY environment variable.")
+    MAX_PROMPT_AREAS = 12            # Maximum work areas sent to the AI (grouped prompt)
+    MESSAGES_PER_AREA = 3            # Commit messages quoted per work area (grouped prompt)
+    RAW_PROMPT_COMMITS = 20          # Commits listed per request (raw prompt)
+    MAX_CHUNK_TOKENS = 3000          # Commit line tokens per raw prompt request before a window is split into chunks
+
+    MAX_REQUESTS_PER_MINUTE = 3500   # OpenAI rate limits to pace requests against
+    MAX_TOKENS_PER_MINUTE = 90000
+    MAX_API_ATTEMPTS = 5             # OpenAI attempts before giving up on transient errors
+    RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+    REPORT_SUMMARY_SLOT = 1          # Index of the AI summary in build_report_parts
+
+    COMMIT_SENTINEL = "__COMMIT__"   # Marks the start of each commit record in git log output
+    GIT_COMMAND_TIMEOUT = 30         # Seconds a git command may run before it is killed
+    GIT_SHOW_BATCH_SIZE = 200        # Commits per git show call when reading uncached commits
+    GIT_SHOW_MIN_BATCH_SIZE = 25     # Fewer uncached commits than this are read by a single git show
+    GIT_SHOW_WORKERS = 4             # git show processes run side by side for larger sets
+    COMMIT_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'git_summarizer', 'commits.json')
+
+    def __init__(self, api_key: Optional[str] = None, raw_prompt: bool = False,
+                 requests_per_minute: Optional[int] = None, tokens_per_minute: Optional[int] = None):
+        """Initialize the summarizer with OpenAI API key.
+
+        With raw_prompt, individual commit messages are sent to the AI instead of
+        commits grouped into work areas. requests_per_minute and tokens_per_minute
+        override the OpenAI rate limits requests are paced against.
+        """
+        self.api_key = self.resolve_api_key(api_key)
+
+        self.raw_prompt = raw_prompt
+        self.system_prompt = SYSTEM_PROMPT.substitute(bullet_points=self.MAX_BULLET_POINTS)
+        self.batch_system_prompt = BATCH_SYSTEM_PROMPT.substitute(bullet_points=self.MAX_BULLET_POINTS)
+        self.summary_guidelines = self.build_summary_guidelines()
+        self.token_bucket = TokenBucket(
+            self.AI_MODEL,
+            requests_per_minute or self.MAX_REQUESTS_PER_MINUTE,
+            tokens_per_minute or self.MAX_TOKENS_PER_MINUTE
+        )
 
         self.openai_url = "https://api.openai.com/v1/chat/completions"
-        self.ist_timezone = pytz.timezone('Asia/Kolkata')
+        # One pooled client so retries and batches reuse the same connection
+        self.http_client = None  # Created on first use by get_http_client
+        self.ist_timezone = ZoneInfo('Asia/Kolkata')
         self.log_file = f"git_summary_log_{datetime.now().strftime('%Y%m%d')}.log"
+        self.user_info = None  # Cached by get_git_user_info
+        self.repository = None  # pygit2 repository opened once by get_repository (False if unavailable)
+        self.token_encoding = None  # tiktoken encoding loaded once by count_tokens (False if unavailable)
+        self.log_timestamp = (None, '')  # (epoch second, formatted time) reused by log_message
+
+        # Log lines are written by a background thread through a single open handle
+        try:
+            self.log_handle = open(self.log_file, 'a', buffering=1, encoding='utf-8')
+        except Exception as e:
+            print(f"Warning: Could not open log file: {e}")
+            self.log_handle = None
+
+        self.log_queue = queue.Queue()
+        self.log_closed = False  # Set by close_log; later messages are only printed
+        self.log_writer = threading.Thread(target=self.write_log_entries, daemon=True)
+        self.log_writer.start()
+        atexit.register(self.close_log)
+
+    @staticmethod
+    def resolve_api_key(api_key: Optional[str] = None) -> str:
+        """Return the given API key or OPENAI_API_KEY, raising ValueError if neither is set."""
+        api_key = api_key or os.getenv('OPENAI_API_KEY')
+        if not api_key:
+            raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY environment variable.")
+        return api_key
+
+    def write_log_entries(self):
+        """Write queued log entries to the log file until close_log is called."""
+        while True:
+            log_entry = self.log_queue.get()
+            if log_entry is None:
+                break
+
+            if self.log_handle is None:
+                continue
+
+            try:
+                self.log_handle.write(log_entry + '\n')
+            except Exception as e:
+                print(f"Warning: Could not write to log file: {e}")
+
+    def close_log(self):
+        """Flush pending log entries, stop the writer thread and close the log file; later calls do nothing."""
+        if self.log_closed:
+            return
+        self.log_closed = True
+
+        self.log_queue.put(None)
+        self.log_writer.join(timeout=5)
+
+        if self.log_handle is not None:
+            self.log_handle.close()
+            self.log_handle = None
+
+        # The atexit hook holds a reference to this summarizer; it is no longer needed
+        atexit.unregister(self.close_log)
+
+    def close(self):
+        """Close the pooled OpenAI connection and the log file.
+
+        A later request opens a new connection; later log messages are only printed.
+        """
+        if self.http_client is not None:
+            self.http_client.close()
+            self.http_client = None
+        self.close_log()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def log_message(self, message: str, level: str = "INFO"):
         """Log message to both console and file."""
-        timestamp = datetime.now(self.ist_timezone).strftime('%Y-%m-%d %H:%M:%S')
+        # Bursts of log lines share a second, so format each second only once
+        second = int(time.time())
+        cached_second, timestamp = self.log_timestamp
+        if second != cached_second:
+            timestamp = datetime.fromtimestamp(second, self.ist_timezone).strftime('%Y-%m-%d %H:%M:%S')
+            self.log_timestamp = (second, timestamp)
+
         log_entry = f"[{timestamp}] [{level}] {message}"
 
         print(log_entry)
-
-        try:
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(log_entry + '\n')
-        except Exception as e:
-            print(f"Warning: Could not write to log file: {e}")
+        if not self.log_closed:
+            self.log_queue.put_nowait(log_entry)
 
     def check_git_repository(self) -> bool:
         """Check if current directory is a git repository."""
         return os.path.exists('.git')
 
+    def get_repository(self):
+        """Open the repository with pygit2 once and reuse it, or return None if pygit2 is unavailable."""
+        if self.repository is None:
+            self.repository = False  # Only try once
+            pygit2 = import_optional('pygit2')
+            if pygit2 is not None:
+                try:
+                    self.repository = pygit2.Repository('.')
+                except Exception as e:
+                    self.log_message(f"Could not open repository with pygit2: {e}", "WARNING")
+        return self.repository if self.repository is not False else None
+
     def get_git_user_info(self) -> Dict[str, str]:
-        """Get the current git user information."""
+        """Get the current git user information (looked up once per run)."""
+        if self.user_info is not None:
+            return self.user_info
+
         try:
-            name_result = subprocess.run(['git', 'config', 'user.name'], capture_output=True, text=True)
-            email_result = subprocess.run(['git', 'config', 'user.email'], capture_output=True, text=True)
+            # pygit2 reads the same layered git config in-process, without starting git
+            repo = self.get_repository()
+            if repo is not None:
+                config = repo.config
+                self.user_info = {
+                    "name": config['user.name'] if 'user.name' in config else "",
+                    "email": config['user.email'] if 'user.email' in config else ""
+                }
+                return self.user_info
+
+            # Both lookups are dominated by git process startup, so run them side by side
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                name_result, email_result = executor.map(
+                    lambda key: subprocess.run(['git', 'config', key], capture_output=True, text=True,
+                                               timeout=self.GIT_COMMAND_TIMEOUT),
+                    ['user.name', 'user.email']
+                )
 
             user_name = name_result.stdout.strip() if name_result.returncode == 0 else ""
             user_email = email_result.stdout.strip() if email_result.returncode == 0 else ""
 
-            return {"name": user_name, "email": user_email}
+            self.user_info = {"name": user_name, "email": user_email}
+            return self.user_info
         except Exception as e:
             self.log_message(f"Error getting git user info: {e}", "WARNING")
             return {"name": "", "email": ""}
@@ -72,139 +371,419 @@ class GitCommitSummarizer:
             now = now - timedelta(hours=hours_back)
         return now.strftime('%Y-%m-%d %H:%M:%S')
 
-    def execute_git_command(self, command: List[str]) -> List[str]:
-        """Execute a git command and return output lines."""
+    @staticmethod
+    def split_stream(stream, separator: bytes, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Yield the separator-terminated records of a binary stream as they arrive."""
+        pending = b''
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            records = (pending + chunk).split(separator)
+            pending = records.pop()
+            yield from records
+
+        if pending:
+            yield pending
+
+    def execute_git_command_stream(self, command: List[str], separator: bytes = b'\n') -> Iterator[bytes]:
+        """Execute a git command and yield raw output records as git produces them.
+
+        Records are bytes so callers only decode the fields they keep. With a
+        separator other than newline (b'\0' for git's -z output) records are
+        yielded verbatim instead of stripped.
+        """
         try:
-            result = subprocess.run(
+            process = subprocess.Popen(
                 command,
-                capture_output=True,
-                text=True,
-                timeout=30,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 cwd='.'
             )
+        except Exception as e:
+            self.log_message(f"Error executing git command: {e}", "ERROR")
+            return
+
+        # The deadline covers the whole command: a stalled git is killed, which ends the
+        # stdout stream. stderr is drained alongside so a chatty git can't fill its pipe
+        timed_out = threading.Event()
+
+        def kill_on_deadline():
+            timed_out.set()
+            process.kill()
 
-            if result.returncode == 0:
-                return [line.strip() for line in result.stdout.strip().split('\n') if line.strip()]
+        deadline = threading.Timer(self.GIT_COMMAND_TIMEOUT, kill_on_deadline)
+        stderr_chunks = []
+        stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True)
+
+        with process:
+            deadline.start()
+            stderr_reader.start()
+            try:
+                if separator == b'\n':
+                    records = (line.strip() for line in process.stdout)
+                else:
+                    records = self.split_stream(process.stdout, separator)
+
+                for record in records:
+                    if record:
+                        yield record
+            except GeneratorExit:
+                # The caller stopped reading; don't leave git blocked on a full pipe
+                process.kill()
+                raise
+            finally:
+                deadline.cancel()
+
+            stderr_reader.join()
+            process.wait()
+
+            if timed_out.is_set():
+                self.log_message(f"Git command timed out: {' '.join(command)}", "WARNING")
+            elif process.returncode != 0:
+                stderr = b''.join(stderr_chunks).decode('utf-8', errors='replace')
+                self.log_message(f"Git command failed: {' '.join(command)} - {stderr}", "WARNING")
+
+    def iter_log_records(self, lines: Iterable[bytes]):
+        """Group raw git log output into (header, body_lines) records split on COMMIT_SENTINEL."""
+        sentinel = self.COMMIT_SENTINEL.encode('ascii')
+        header = None
+        body_lines = []
+
+        for line in lines:
+            if line.startswith(sentinel):
+                if header is not None:
+                    yield header, body_lines
+                header = line[len(sentinel):]
+                body_lines = []
+            elif header is not None:
+                body_lines.append(line)
+
+        if header is not None:
+            yield header, body_lines
+
+    def split_commit_headers(self, records: Iterable[bytes]) -> Iterator[bytes]:
+        """Separate each commit header from the first path that follows it in -z output.
+
+        With -z, git ends the header with a newline but runs straight into the first
+        NUL-terminated path, so '<sentinel><hash>\n<path>' arrives as one record.
+        """
+        sentinel = self.COMMIT_SENTINEL.encode('ascii')
+        for record in records:
+            if record.startswith(sentinel):
+                header, _, first_path = record.partition(b'\n')
+                yield header
+                if first_path:
+                    yield first_path
             else:
-                self.log_message(f"Git command failed: {' '.join(command)} - {result.stderr}", "WARNING")
-                return []
+                yield record
+
+    def is_my_commit(self, user_info: Dict[str, str], author_name: str, author_email: str) -> bool:
+        """Check if a commit author matches the current git user."""
+        return bool(
+                (user_info['name'] and user_info['name'].lower() in author_name.lower()) or
+                (user_info['email'] and user_info['email'].lower() in author_email.lower())
+        )
+
+    def build_commit_info(self, hash_full: str, author_name: str, author_email: str, date: str, message: str,
+                          branch: str, branch_info: str, files_changed: List[str], commit_time: int) -> Dict:
+        """Build the commit dictionary shared by every git backend."""
+        # Remove 'origin/' prefix for consistency between local and remote branches
+        if branch.startswith('origin/'):
+            branch = branch[len('origin/'):]
+
+        # One pass over the files: each extension is computed once and reused for the
+        # Kotlin/Android buckets and the file type counts. Functions and bound methods
+        # are held in locals so the loop doesn't look them up for every file
+        kotlin_files = []
+        android_files = []
+        extensions = []
+        extension_of = file_extension
+        android_exts, kotlin_exts = ANDROID_EXTS, KOTLIN_EXTS
+        kotlin_append, android_append, extensions_append = kotlin_files.append, android_files.append, extensions.append
+        for f in files_changed:
+            ext = extension_of(f)
+            extensions_append(ext or 'no_extension')
+            if ext in android_exts:
+                android_append(f)
+                if ext in kotlin_exts:
+                    kotlin_append(f)
+
+        # Counter counts a list in C, instead of a Python-level += per file
+        file_types = Counter(extensions)
+
+        return {
+            'hash': hash_full[:8],
+            'hash_full': hash_full,
+            'author': author_name,
+            'email': author_email,
+            'date': date,
+            'commit_time': commit_time,  # Committer timestamp, the date git log --since filters on
+            'message': message,
+            'branch': branch,
+            'branch_info': branch_info,
+            'files_changed': files_changed,
+            'kotlin_files': kotlin_files,
+            'android_files': android_files,
+            'file_types': file_types
+        }
+
+    def load_commit_cache(self) -> Dict[str, Dict]:
+        """Load the on-disk cache of per-commit file lists, keyed by full commit hash."""
+        try:
+            with open(self.COMMIT_CACHE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.log_message(f"Could not read commit cache, continuing without it: {e}", "WARNING")
+            return {}
 
-        except subprocess.TimeoutExpired:
-            self.log_message(f"Git command timed out: {' '.join(command)}", "WARNING")
-            return []
+    def save_commit_cache(self, commit_cache: Dict[str, Dict]):
+        """Write the commit cache to a temporary file and swap it in, so readers never see a partial file."""
+        cache_dir = os.path.dirname(self.COMMIT_CACHE_FILE)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(commit_cache, f, ensure_ascii=False, separators=(',', ':'))
+                os.replace(temp_path, self.COMMIT_CACHE_FILE)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
         except Exception as e:
-            self.log_message(f"Error executing git command: {e}", "ERROR")
-            return []
+            self.log_message(f"Could not save commit cache: {e}", "WARNING")
+
+    def get_commit_files(self, hashes: List[str]) -> Dict[str, Dict]:
+        """Get the files changed by the given commits, sharding large sets across parallel git show calls."""
+        # Split evenly across the workers, but keep each command line well under OS argument
+        # limits and don't start extra processes for a handful of commits
+        batch_size = min(self.GIT_SHOW_BATCH_SIZE,
+                         max(self.GIT_SHOW_MIN_BATCH_SIZE, -(-len(hashes) // self.GIT_SHOW_WORKERS)))
+        batches = [hashes[start:start + batch_size] for start in range(0, len(hashes), batch_size)]
+        if len(batches) <= 1:
+            return self.read_commit_files(hashes)
+
+        commit_files = {}
+        with ThreadPoolExecutor(max_workers=min(self.GIT_SHOW_WORKERS, len(batches))) as executor:
+            for batch_files in executor.map(self.read_commit_files, batches):
+                commit_files.update(batch_files)
+        return commit_files
+
+    def read_commit_files(self, hashes: List[str]) -> Dict[str, Dict]:
+        """Read the files changed by the given commits with one git show call."""
+        commit_files = {}
+        if not hashes:
+            return commit_files
+
+        # -z gives NUL-terminated paths that git leaves unquoted, whatever characters they contain
+        show_command = [
+            'git', 'show', '-z',
+            f'--pretty=format:{self.COMMIT_SENTINEL}%H',
+            '--name-only'
+        ] + hashes
+
+        records = self.execute_git_command_stream(show_command, separator=b'\0')
+        for hash_full, paths in self.iter_log_records(self.split_commit_headers(records)):
+            commit_files[hash_full.decode('ascii')] = {
+                'files_changed': [path.decode('utf-8', errors='replace') for path in paths]
+            }
 
-    def get_all_branches(self) -> List[str]:
-        """Get all branches (local and remote)."""
-        # Get local branches
-        local_branches = self.execute_git_command(['git', 'branch', '--format=%(refname:short)'])
+        return commit_files
 
-        # Get remote branches
-        remote_branches = self.execute_git_command(['git', 'branch', '-r', '--format=%(refname:short)'])
+    def get_commits_with_git_log(self, user_info: Dict[str, str], since_time: str, commit_cache) -> List[Dict]:
+        """Get the user's commits from all branches by parsing a single git log stream."""
+        all_commits = []
+        seen_hashes = set()
+
+        # Build author filter; git ORs multiple --author values, and --fixed-strings with
+        # --regexp-ignore-case gives the same case-insensitive substring match as is_my_commit
+        author_filters = []
+        if user_info['name']:
+            author_filters.extend(['--author', user_info['name']])
+        if user_info['email']:
+            author_filters.extend(['--author', user_info['email']])
+
+        if not author_filters:
+            self.log_message("No git user.name or user.email configured, cannot identify your commits", "WARNING")
+            return all_commits
+
+        # One git log walks every local and remote branch; %S names the branch each
+        # commit was reached from. Only headers are read here, which needs no diffs.
+        # Fields are separated by the ASCII unit separator (%x1f): unlike '|', it does not
+        # turn up in author names or ref names, and the free-form subject is split off last
+        commit_command = [
+                             'git', 'log',
+                             '--branches', '--exclude=*/HEAD', '--remotes',
+                             # since_time is IST wall-clock time; without the offset git reads it as local time
+                             f"--since={since_time} {datetime.now(self.ist_timezone).strftime('%z')}",
+                             f'--pretty=format:{self.COMMIT_SENTINEL}%H%x1f%an%x1f%ae%x1f%ad%x1f%ct%x1f%S%x1f%D%x1f%s',
+                             '--date=iso',
+                             '--no-merges',
+                             '--fixed-strings',
+                             '--regexp-ignore-case'
+                         ] + author_filters
+
+        # Stream the log so parsing overlaps with git walking the history
+        commit_lines = self.execute_git_command_stream(commit_command)
+
+        headers = []
+        for header, _ in self.iter_log_records(commit_lines):
+            parts = header.split(b'\x1f', 7)
+            if len(parts) < 8:
+                continue
 
-        # Combine and clean up
-        all_branches = set()
+            # Skip if we already have this commit
+            hash_full = parts[0].decode('ascii')
+            if hash_full in seen_hashes:
+                continue
+            seen_hashes.add(hash_full)
+
+            # Hash and dates are ASCII; only the free-text fields need a UTF-8 decode
+            headers.append([hash_full] +
+                           [field.decode('utf-8', errors='replace') for field in parts[1:3]] +
+                           [field.decode('ascii') for field in parts[3:5]] +
+                           [field.decode('utf-8', errors='replace') for field in parts[5:]])
+
+        # Commits are immutable, so only commits never seen before need their files read
+        missing_hashes = [parts[0] for parts in headers if parts[0] not in commit_cache]
+        if missing_hashes:
+            for hash_full, files in self.get_commit_files(missing_hashes).items():
+                commit_cache[hash_full] = files
+        self.log_message(f"Commit cache: {len(headers) - len(missing_hashes)} hits, {len(missing_hashes)} misses")
+
+        for parts in headers:
+            files = commit_cache.get(parts[0], {'files_changed': []})
+
+            all_commits.append(self.build_commit_info(
+                parts[0], parts[1], parts[2], parts[3], parts[7],
+                branch=parts[5],
+                branch_info=parts[6],
+                files_changed=files['files_changed'],
+                commit_time=int(parts[4])
+            ))
+
+        return all_commits
+
+    def get_commits_with_pygit2(self, user_info: Dict[str, str], hours_back: int, commit_cache) -> List[Dict]:
+        """Get the user's commits from all branches by reading the repository in-process with pygit2."""
+        repo = self.get_repository()
+        since_timestamp = time.time() - hours_back * 3600
 
-        for branch in local_branches:
-            if branch and not branch.startswith('*'):
-                all_branches.add(branch.strip('* '))
+        all_commits = []
 
-        for branch in remote_branches:
-            if branch and not branch.startswith('origin/HEAD'):
-                # Remove 'origin/' prefix for consistency
-                clean_branch = branch.replace('origin/', '')
-                all_branches.add(clean_branch)
+        branch_names = list(repo.branches.local) + [
+            name for name in repo.branches.remote if not name.endswith('/HEAD')
+        ]
 
-        return list(all_branches)
+        # Branch tips carry their branch names, like git log's %D decoration
+        decorations = {}
+        for name in branch_names:
+            decorations.setdefault(str(repo.branches[name].target), []).append(name)
+
+        for commit, branch_name in self.walk_recent_commits(repo, branch_names, since_timestamp):
+            hash_full = str(commit.id)
+
+            # Skip merges and commits by other authors
+            if len(commit.parents) > 1:
+                continue
+            if not self.is_my_commit(user_info, commit.author.name, commit.author.email):
+                continue
+
+            files = commit_cache.get(hash_full)
+            if files is None:
+                if commit.parents:
+                    diff = repo.diff(commit.parents[0], commit)
+                else:
+                    diff = commit.tree.diff_to_tree(swap=True)
+                diff.find_similar()
+
+                # Deltas only name the files; no line-level patches are generated
+                files = {'files_changed': [delta.new_file.path for delta in diff.deltas]}
+                commit_cache[hash_full] = files
+
+            author_tz = timezone(timedelta(minutes=commit.author.offset))
+            date = datetime.fromtimestamp(commit.author.time, author_tz).strftime('%Y-%m-%d %H:%M:%S %z')
+            subject = commit.message.strip().split('\n\n', 1)[0].replace('\n', ' ')
+
+            all_commits.append(self.build_commit_info(
+                hash_full, commit.author.name, commit.author.email, date, subject,
+                branch=branch_name,
+                branch_info=', '.join(decorations.get(hash_full, [])),
+                files_changed=files['files_changed'],
+                commit_time=commit.commit_time
+            ))
+
+        return all_commits
+
+    @staticmethod
+    def walk_recent_commits(repo, branch_names: List[str], since_timestamp: float) -> Iterator[Tuple]:
+        """Yield (commit, branch name) for each commit reachable from the branches since the timestamp.
+
+        repo.walk with GIT_SORT_TIME makes libgit2 load and sort the whole history
+        before the first commit comes out. Here the frontier of pending commits is
+        kept in a heap, newest first, and the walk stops as soon as the newest
+        pending commit is older than the cutoff, like git log --since. Commits are
+        credited to branches like git log --source: each branch tip to its own branch,
+        and any other commit to the branch of the first commit that reached it.
+        """
+        order = count()  # Tie-breaker so commits themselves are never compared
+        sources = {}  # Commit id -> branch name, set when the commit is first queued
+        frontier = []
+        for branch_name in branch_names:
+            tip = repo[repo.branches[branch_name].target]
+            if tip.id not in sources:
+                sources[tip.id] = branch_name
+                heapq.heappush(frontier, (-tip.commit_time, next(order), tip))
+
+        while frontier:
+            negative_time, _, commit = heapq.heappop(frontier)
+            if -negative_time < since_timestamp:
+                break
+
+            yield commit, sources[commit.id]
+
+            # A commit is only queued once, by whichever commit reaches it first
+            for parent in commit.parents:
+                if parent.id not in sources:
+                    sources[parent.id] = sources[commit.id]
+                    heapq.heappush(frontier, (-parent.commit_time, next(order), parent))
 
     def get_my_commits_from_all_branches(self, hours_back: int = 24) -> List[Dict]:
         """Get commits from all branches that belong to the current user."""
+        return self.limit_commits(self.collect_my_commits(hours_back))
+
+    def collect_my_commits(self, hours_back: int) -> List[Dict]:
+        """Collect every commit by the current user from all branches, before limit_commits is applied."""
         user_info = self.get_git_user_info()
         since_time = self.get_ist_time(hours_back)
 
         self.log_message(f"Searching for commits by: {user_info['name']} <{user_info['email']}>")
         self.log_message(f"Time range: Since {since_time} IST")
+        self.log_message("Checking all local and remote branches")
 
-        all_commits = []
-        branches = self.get_all_branches()
-
-        self.log_message(f"Checking {len(branches)} branches: {', '.join(branches[:5])}{'...' if len(branches) > 5 else ''}")
-
-        for branch in branches:
-            try:
-                # Build author filter
-                author_filters = []
-                if user_info['name']:
-                    author_filters.extend(['--author', user_info['name']])
-                if user_info['email']:
-                    author_filters.extend(['--author', user_info['email']])
-
-                # Get commits for this branch
-                commit_command = [
-                                     'git', 'log', branch,
-                                     f'--since={since_time}',
-                                     '--pretty=format:%H|%an|%ae|%ad|%s|%D',
-                                     '--date=iso',
-                                     '--no-merges'
-                                 ] + author_filters
-
-                commit_lines = self.execute_git_command(commit_command)
-
-                for line in commit_lines:
-                    if '|' in line:
-                        parts = line.split('|', 5)
-                        if len(parts) >= 5:
-                            hash_full = parts[0]
-
-                            # Skip if we already have this commit
-                            if any(c['hash_full'] == hash_full for c in all_commits):
-                                continue
-
-                            # Check if this commit is actually by the current user
-                            author_name = parts[1]
-                            author_email = parts[2]
-
-                            is_my_commit = (
-                                    (user_info['name'] and user_info['name'].lower() in author_name.lower()) or
-                                    (user_info['email'] and user_info['email'].lower() in author_email.lower())
-                            )
-
-                            if not is_my_commit:
-                                continue
-
-                            hash_short = hash_full[:8]
-                            branch_info = parts[5] if len(parts) > 5 else branch
-
-                            # Get files changed in this commit
-                            files_command = ['git', 'show', '--name-only', '--pretty=format:', hash_full]
-                            files_changed = [f for f in self.execute_git_command(files_command) if f]
-
-                            # Get commit diff summary
-                            diff_command = ['git', 'show', '--stat', '--pretty=format:', hash_full]
-                            diff_stats = '\n'.join(self.execute_git_command(diff_command))
-
-                            commit_info = {
-                                'hash': hash_short,
-                                'hash_full': hash_full,
-                                'author': author_name,
-                                'email': author_email,
-                                'date': parts[3],
-                                'message': parts[4],
-                                'branch': branch,
-                                'branch_info': branch_info,
-                                'files_changed': files_changed,
-                                'kotlin_files': [f for f in files_changed if f.endswith('.kt')],
-                                'android_files': [f for f in files_changed if f.endswith(('.kt', '.xml', '.java', '.gradle'))],
-                                'diff_stats': diff_stats
-                            }
-                            all_commits.append(commit_info)
-
-            except Exception as e:
-                self.log_message(f"Error processing branch {branch}: {e}", "WARNING")
-                continue
-
+        commit_cache = self.load_commit_cache()
+        cached_count = len(commit_cache)
+        try:
+            all_commits = None
+            if self.get_repository() is not None:
+                try:
+                    all_commits = self.get_commits_with_pygit2(user_info, hours_back, commit_cache)
+                except Exception as e:
+                    self.log_message(f"pygit2 backend failed, falling back to git command line: {e}", "WARNING")
+
+            if all_commits is None:
+                all_commits = self.get_commits_with_git_log(user_info, since_time, commit_cache)
+        finally:
+            # Entries are only ever added, so a grown cache is the only one worth rewriting
+            if len(commit_cache) != cached_count:
+                self.save_commit_cache(commit_cache)
+
+        return all_commits
+
+    def limit_commits(self, all_commits: List[Dict]) -> List[Dict]:
+        """Return the MAX_COMMITS_TO_ANALYZE most recent of the collected commits, newest first."""
         # Sort commits by date (newest first) and limit to MAX_COMMITS_TO_ANALYZE
         all_commits.sort(key=lambda x: x['date'], reverse=True)
         limited_commits = all_commits[:self.MAX_COMMITS_TO_ANALYZE]
@@ -229,73 +808,182 @@ class GitCommitSummarizer:
                 'android_file_list': []
             }
 
+        # One set.update call per set takes every commit's files at once
         all_files = set()
+        all_files.update(*(commit['files_changed'] for commit in commits))
         all_kotlin_files = set()
+        all_kotlin_files.update(*(commit['kotlin_files'] for commit in commits))
         all_android_files = set()
-        branches = set()
-        file_types = {}
+        all_android_files.update(*(commit['android_files'] for commit in commits))
+        branches = {commit['branch'] for commit in commits}
 
+        file_types = Counter()
         for commit in commits:
-            branches.add(commit['branch'])
-
-            for file in commit['files_changed']:
-                all_files.add(file)
-
-                # Count file types
-                ext = os.path.splitext(file)[1] or 'no_extension'
-                file_types[ext] = file_types.get(ext, 0) + 1
-
-            for kt_file in commit['kotlin_files']:
-                all_kotlin_files.add(kt_file)
-
-            for android_file in commit['android_files']:
-                all_android_files.add(android_file)
+            file_types.update(commit['file_types'])
 
         return {
             'total_commits': len(commits),
             'total_files': len(all_files),
             'kotlin_files': len(all_kotlin_files),
             'android_files': len(all_android_files),
-            'branches': list(branches),
-            'file_types': file_types,
-            'kotlin_file_list': list(all_kotlin_files),
-            'android_file_list': list(all_android_files)
+            # Sorted once here so the prompt and report list them in a stable order
+            'branches': sorted(branches),
+            'file_types': dict(file_types),
+            'kotlin_file_list': sorted(all_kotlin_files),
+            'android_file_list': sorted(all_android_files)
         }
 
-    def generate_bullet_summary(self, commits: List[Dict], analysis: Dict) -> str:
-        """Generate AI-powered bullet point summary focused on concise work accomplishments."""
-        if not commits:
-            return "• No commits found in the specified time period by you."
-
-        # Log configuration being used
-        self.log_message(f"AI Configuration: Model={self.AI_MODEL}, MaxTokens={self.MAX_TOKENS}, MaxBullets={self.MAX_BULLET_POINTS}, MaxWords={self.MAX_WORDS_PER_BULLET}")
-
-        # Prepare concise commit info for AI (limit to prevent token overflow)
-        commits_to_analyze = min(len(commits), 20)  # Analyze max 20 commits for token efficiency
-        commit_summaries = []
+    @staticmethod
+    def work_area(path: str) -> str:
+        """Return the work area a file belongs to: its package below java/ or kotlin/, else its directory."""
+        directory = path.rpartition('/')[0]
+        if not directory:
+            return 'root'
+
+        # Packages say more than leaf directories like 'ui' or 'src', which recur across modules
+        padded = f'/{directory}/'
+        source_root = max(padded.rfind('/java/'), padded.rfind('/kotlin/'))
+        if source_root >= 0:
+            package = padded[padded.index('/', source_root + 1) + 1:-1]
+            if package:
+                return package
+        return directory
+
+    def group_commits_by_area(self, commits: List[Dict]) -> Tuple[List[str], int]:
+        """Condense commits into one prompt line per work area, returning the lines and the number of areas.
+
+        A commit's work area is the package or directory most of its files live in, so
+        related commits collapse into a line like "[com/example/auth] 6 commits touching
+        9 files: ...". Past MAX_PROMPT_AREAS, the smallest areas share one "[other]" line
+        so every commit is still counted.
+        """
+        areas = {}
+        for commit in commits:
+            directories = Counter(map(self.work_area, commit['files_changed']))
+            area = directories.most_common(1)[0][0] if directories else 'misc'
+
+            # messages is an insertion-ordered dict used as a set, so deduplicating stays O(1)
+            group = areas.setdefault(area, {'commits': 0, 'files': set(), 'messages': {}})
+            group['commits'] += 1
+            group['files'].update(commit['files_changed'])
+            group['messages'][commit['message']] = None
+
+        largest_first = sorted(areas.items(), key=lambda item: item[1]['commits'], reverse=True)
+        if len(largest_first) > self.MAX_PROMPT_AREAS:
+            folded = largest_first[self.MAX_PROMPT_AREAS - 1:]
+            other = {'commits': 0, 'files': set(), 'messages': {}}
+            for _, group in folded:
+                other['commits'] += group['commits']
+                other['files'].update(group['files'])
+                other['messages'].update(group['messages'])
+            largest_first = largest_first[:self.MAX_PROMPT_AREAS - 1] + [(f'other: {len(folded)} areas', other)]
+
+        lines = []
+        for area, group in largest_first:
+            messages = [message if len(message) <= 60 else message[:57] + "..."
+                        for message in islice(group['messages'], self.MESSAGES_PER_AREA)]
+            more = len(group['messages']) - len(messages)
+            lines.append(f"[{area}] {group['commits']} commits touching {len(group['files'])} files: "
+                         f"{'; '.join(messages)}{f' (+{more} more)' if more > 0 else ''}")
+        return lines, len(areas)
+
+    @staticmethod
+    def format_commit_line(commit: Dict) -> str:
+        """Format one commit as a line of the raw prompt."""
+        summary = f"[{commit['branch']}] {commit['message']}"
+        if commit['kotlin_files']:
+            summary += f" (Kotlin: {', '.join(commit['kotlin_files'][:3])})"
+        return summary
+
+    def count_tokens(self, text: str) -> int:
+        """Count the tokens text uses with tiktoken, or estimate ~4 characters per token without it."""
+        if self.token_encoding is None:
+            self.token_encoding = False  # Estimate unless an encoding loads
+            tiktoken = import_optional('tiktoken')
+            if tiktoken is not None:
+                try:
+                    self.token_encoding = tiktoken.encoding_for_model(self.AI_MODEL)
+                except Exception as e:
+                    self.log_message(f"Could not load tiktoken encoding, estimating tokens instead: {e}", "WARNING")
+
+        if self.token_encoding:
+            return len(self.token_encoding.encode(text))
+        return len(text) // 4 + 1
+
+    def chunk_commits_by_tokens(self, commits: List[Dict]) -> List[List[Dict]]:
+        """Split commits, in order, into chunks that each fit in one summary request.
+
+        Only the raw prompt lists commits one per line; the grouped prompt is already
+        capped by MAX_PROMPT_AREAS and MESSAGES_PER_AREA, so it is never split. Raw
+        chunks are bounded by RAW_PROMPT_COMMITS, so no commit is left out of the
+        listing, and by MAX_CHUNK_TOKENS of commit lines.
+        """
+        if not self.raw_prompt:
+            return [commits]
+
+        lines = [self.format_commit_line(commit) for commit in commits]
+        # A token is at least one byte, so windows this small fit without loading tiktoken
+        if len(commits) <= self.RAW_PROMPT_COMMITS and \
+                sum(len(line.encode('utf-8')) for line in lines) <= self.MAX_CHUNK_TOKENS:
+            return [commits]
+
+        chunks = []
+        chunk = []
+        chunk_tokens = 0
+
+        for commit, line in zip(commits, lines):
+            tokens = self.count_tokens(line)
+            if chunk and (chunk_tokens + tokens > self.MAX_CHUNK_TOKENS or len(chunk) >= self.RAW_PROMPT_COMMITS):
+                chunks.append(chunk)
+                chunk = []
+                chunk_tokens = 0
+            chunk.append(commit)
+            chunk_tokens += tokens
+
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def build_window_details(self, commits: List[Dict], analysis: Dict) -> str:
+        """Build the commit details and statistics section of the prompt for one time window."""
+        if self.raw_prompt:
+            # Prepare concise commit info for AI (limit to prevent token overflow)
+            commits_to_analyze = min(len(commits), self.RAW_PROMPT_COMMITS)
+            commit_summaries = [self.format_commit_line(commit) for commit in islice(commits, commits_to_analyze)]
+
+            commit_section = f"""COMMITS ANALYZED: {commits_to_analyze} of {len(commits)} total commits
 
-        for commit in commits[:commits_to_analyze]:
-            summary = f"[{commit['branch']}] {commit['message']}"
-            if commit['kotlin_files']:
-                summary += f" (Kotlin: {', '.join(commit['kotlin_files'][:3])})"
-            commit_summaries.append(summary)
+COMMIT DETAILS:
+{chr(10).join(commit_summaries)}"""
+        else:
+            # Grouping keeps the prompt short while still covering every commit
+            work_areas, area_count = self.group_commits_by_area(commits)
+            commit_section = f"""COMMITS ANALYZED: {len(commits)} commits grouped into {area_count} work areas
 
-        # UPDATED: New prompt focused on concise high-level work accomplishments
-        prompt = f"""
-Analyze these git commits from an Android Kotlin project and provide a CONCISE HIGH-LEVEL WORK SUMMARY.
+WORK AREAS:
+{chr(10).join(work_areas)}"""
 
-COMMITS ANALYZED: {commits_to_analyze} of {len(commits)} total commits
+        return f"""
+{commit_section}
 
-COMMIT DETAILS:
-{chr(10).join(commit_summaries)}
+{self.build_statistics(analysis)}
+        """.strip()
 
+    def build_statistics(self, analysis: Dict) -> str:
+        """Build the PROJECT STATISTICS section of the prompt."""
+        return f"""
 PROJECT STATISTICS:
 - Total commits: {analysis['total_commits']}
 - Branches worked on: {', '.join(analysis['branches'][:5])}
 - Total files modified: {analysis['total_files']}
 - Kotlin files modified: {analysis['kotlin_files']}
 - Android-specific files: {analysis['android_files']}
+        """.strip()
 
+    def build_summary_guidelines(self) -> str:
+        """Build the summary instructions shared by every time window."""
+        # UPDATED: New prompt focused on concise high-level work accomplishments
+        return f"""
 Provide EXACTLY {self.MAX_BULLET_POINTS} concise bullet points that summarize what was accomplished.
 
 FOCUS ON:
@@ -330,51 +1018,296 @@ EXAMPLE FORMAT (Concise and Direct):
 Keep it simple, direct, and factual. Avoid superlatives and promotional language.
         """.strip()
 
+    def build_summary_payload(self, commits: List[Dict], analysis: Dict) -> Dict:
+        """Build the OpenAI chat completion payload for a bullet point summary."""
+        prompt = SUMMARY_PROMPT.substitute(
+            details=self.build_window_details(commits, analysis),
+            guidelines=self.summary_guidelines
+        )
+        return self.build_completion_payload(prompt)
+
+    def build_completion_payload(self, prompt: str) -> Dict:
+        """Wrap a summary prompt in the chat completion payload sent to OpenAI."""
+        return {
+            'model': self.AI_MODEL,
+            'messages': [
+                {
+                    'role': 'system',
+                    'content': self.system_prompt
+                },
+                {
+                    'role': 'user',
+                    'content': prompt
+                }
+            ],
+            'temperature': self.AI_TEMPERATURE,
+            'max_tokens': self.MAX_TOKENS
+        }
+
+    def build_reduce_payload(self, partial_summaries: List[str], analysis: Dict) -> Dict:
+        """Build the payload that merges the partial summaries of a chunked window into one summary."""
+        parts = '\n\n'.join(f"PART {i}:\n{summary}" for i, summary in enumerate(partial_summaries, 1))
+        prompt = (
+            f"These {len(partial_summaries)} partial work summaries each cover a consecutive group of git commits "
+            "from the same Android Kotlin project. Combine them into one CONCISE HIGH-LEVEL WORK SUMMARY.\n\n"
+            f"{parts}\n\n"
+            f"{self.build_statistics(analysis)}\n\n"
+            f"{self.summary_guidelines}"
+        )
+        return self.build_completion_payload(prompt)
+
+    def handle_summary_response(self, status_code: int, result: Optional[Dict], response_text: str) -> str:
+        """Extract the summary from an OpenAI response, logging usage or the error."""
+        if status_code == 200:
+            summary = result['choices'][0]['message']['content']
+
+            # Log token usage for cost tracking
+            if 'usage' in result:
+                usage = result['usage']
+                estimated_cost = (usage.get('prompt_tokens', 0) * 0.0015 + usage.get('completion_tokens', 0) * 0.002) / 1000
+                self.log_message(f"OpenAI API usage - Prompt: {usage.get('prompt_tokens', 0)}, Completion: {usage.get('completion_tokens', 0)}, Total: {usage.get('total_tokens', 0)}, Est. Cost: ${estimated_cost:.4f}")
+
+            # Count actual bullet points generated
+            bullet_count = len([line for line in summary.split('\n') if line.strip().startswith('•')])
+            self.log_message(f"Generated {bullet_count} bullet points")
+
+            return summary
+        else:
+            error_msg = f"OpenAI API Error {status_code}: {response_text}"
+            self.log_message(error_msg, "ERROR")
+            return f"• AI summary failed: {error_msg}"
+
+    def retry_wait_seconds(self, retry_state) -> float:
+        """Wait for the server's Retry-After if given, otherwise back off exponentially with jitter."""
+        outcome = retry_state.outcome
+        if not outcome.failed:
+            retry_after = outcome.result().headers.get('Retry-After')
+            if retry_after:
+                try:
+                    return min(float(retry_after), 60.0)
+                except ValueError:
+                    pass
+
+        from tenacity import wait_random_exponential
+        return wait_random_exponential(multiplier=1, min=1, max=30)(retry_state)
+
+    def log_retry(self, retry_state):
+        """Log an OpenAI retry before sleeping."""
+        outcome = retry_state.outcome
+        reason = outcome.exception() if outcome.failed else f"HTTP {outcome.result().status_code}"
+        self.log_message(f"OpenAI request failed ({reason}), retrying in {retry_state.next_action.sleep:.1f}s "
+                         f"(attempt {retry_state.attempt_number}/{self.MAX_API_ATTEMPTS})", "WARNING")
+
+    @staticmethod
+    def estimate_tokens(payload: Dict) -> int:
+        """Roughly estimate the tokens a request can use: ~4 characters per prompt token plus max_tokens."""
+        prompt_chars = sum(len(message['content']) for message in payload['messages'])
+        return prompt_chars // 4 + payload['max_tokens']
+
+    def reconcile_usage(self, estimated_tokens: int, result: Optional[Dict]):
+        """Correct the token bucket with the usage reported by OpenAI."""
+        if result and 'usage' in result:
+            self.token_bucket.reconcile(estimated_tokens, result['usage'].get('total_tokens', estimated_tokens))
+
+    def api_headers(self) -> Dict[str, str]:
+        """Headers sent with every OpenAI request; set once on each httpx client."""
+        return {
+            'Authorization': f'Bearer {self.api_key}',
+            'Content-Type': 'application/json'
+        }
+
+    def get_http_client(self):
+        """Create the pooled httpx client on first use and reuse it for every request."""
+        if self.http_client is None:
+            import httpx
+            self.http_client = httpx.Client(
+                http2=import_optional('h2') is not None,
+                timeout=60,
+                limits=httpx.Limits(max_keepalive_connections=10),
+                headers=self.api_headers()
+            )
+        return self.http_client
+
+    def send_completion(self, payload: Dict, estimated_tokens: int) -> 'httpx.Response':
+        """POST a chat completion once, after waiting for rate limit budget."""
+        waited = self.token_bucket.consume(estimated_tokens)
+        if waited:
+            self.log_message(f"Waited {waited:.1f}s for OpenAI rate limit budget")
+        if payload.get('stream'):
+            return self.read_completion_stream(payload)
+        return self.get_http_client().post(self.openai_url, json=payload)
+
+    def read_completion_stream(self, payload: Dict) -> 'httpx.Response':
+        """POST a streaming chat completion and reassemble its server-sent events.
+
+        The result is returned as an ordinary completion response, so retries, usage
+        reconciliation and handle_summary_response treat it like any other.
+        """
+        import httpx
+
+        with self.get_http_client().stream('POST', self.openai_url, json=payload) as response:
+            if response.status_code != 200:
+                response.read()
+                return response
+
+            content = []
+            usage = None
+            for line in response.iter_lines():
+                if not line.startswith('data: '):
+                    continue
+                data = line[len('data: '):]
+                if data == '[DONE]':
+                    break
+
+                event = json.loads(data)
+                # With include_usage, the last event carries usage and no choices
+                if event.get('usage'):
+                    usage = event['usage']
+                for choice in event.get('choices', []):
+                    content.append(choice.get('delta', {}).get('content') or '')
+
+        completion = {'choices': [{'message': {'role': 'assistant', 'content': ''.join(content)}}]}
+        if usage:
+            completion['usage'] = usage
+        return httpx.Response(200, json=completion)
+
+    def retry_options(self) -> Dict:
+        """tenacity options shared by the sync, streaming and async OpenAI requests."""
+        import httpx
+        from tenacity import retry_if_exception_type, retry_if_result, stop_after_attempt
+
+        return {
+            'wait': self.retry_wait_seconds,
+            'stop': stop_after_attempt(self.MAX_API_ATTEMPTS),
+            'retry': (retry_if_exception_type(httpx.TransportError) |
+                      retry_if_result(lambda response: response.status_code in self.RETRYABLE_STATUS_CODES)),
+            'before_sleep': self.log_retry,
+            # Out of attempts: return the last response, or re-raise the last network error
+            'retry_error_callback': lambda retry_state: retry_state.outcome.result()
+        }
+
+    def post_completion(self, payload: Dict) -> 'httpx.Response':
+        """POST a chat completion, retrying network errors and 429/5xx responses."""
+        from tenacity import Retrying
+
+        estimated_tokens = self.estimate_tokens(payload)
+        retrying = Retrying(**self.retry_options())
+        response = retrying(self.send_completion, payload, estimated_tokens)
+
+        if response.status_code == 200:
+            self.reconcile_usage(estimated_tokens, response.json())
+        return response
+
+    def generate_bullet_summary(self, commits: List[Dict], analysis: Dict, stream: bool = False) -> str:
+        """Generate AI-powered bullet point summary focused on concise work accomplishments.
+
+        With stream, the summary is received as server-sent events while it is generated.
+        """
+        import httpx
+
+        if not commits:
+            return "• No commits found in the specified time period by you."
+
+        chunks = self.chunk_commits_by_tokens(commits)
+
+        # Log configuration being used
+        self.log_message(f"AI Configuration: Model={self.AI_MODEL}, MaxTokens={self.MAX_TOKENS}, MaxBullets={self.MAX_BULLET_POINTS}, MaxWords={self.MAX_WORDS_PER_BULLET}")
+
         try:
-            headers = {
-                'Authorization': f'Bearer {self.api_key}',
-                'Content-Type': 'application/json'
-            }
+            if len(chunks) > 1:
+                # Windows too large for one request are summarized in chunks concurrently;
+                # the request merging them is sent (and streamed) like a single summary
+                self.log_message(f"Window too large for one request, summarizing {len(commits)} commits in {len(chunks)} chunks")
+                partial_summaries = self.generate_bullet_summaries(
+                    [(chunk, self.analyze_my_commits(chunk)) for chunk in chunks]
+                )
+                for summary in partial_summaries:
+                    if summary.startswith("• AI summary failed"):
+                        return summary
+
+                self.log_message(f"Merging {len(chunks)} partial summaries")
+                payload = self.build_reduce_payload(partial_summaries, analysis)
+            else:
+                payload = self.build_summary_payload(commits, analysis)
 
-            payload = {
-                'model': self.AI_MODEL,
-                'messages': [
-                    {
-                        'role': 'system',
-                        'content': f'You are a developer creating a concise work summary. Generate exactly {self.MAX_BULLET_POINTS} short, direct bullet points about what was accomplished. Be factual and to the point. Avoid promotional language, superlatives, and boastful tone. Maximum 20 words per bullet point.'
-                    },
-                    {
-                        'role': 'user',
-                        'content': prompt
-                    }
-                ],
-                'temperature': self.AI_TEMPERATURE,
-                'max_tokens': self.MAX_TOKENS
-            }
+            if stream:
+                payload['stream'] = True
+                payload['stream_options'] = {'include_usage': True}
 
-            response = requests.post(self.openai_url, headers=headers, json=payload, timeout=60)
+            response = self.post_completion(payload)
 
-            if response.status_code == 200:
-                result = response.json()
-                summary = result['choices'][0]['message']['content']
+            result = response.json() if response.status_code == 200 else None
+            return self.handle_summary_response(response.status_code, result, response.text)
 
-                # Log token usage for cost tracking
-                if 'usage' in result:
-                    usage = result['usage']
-                    estimated_cost = (usage.get('prompt_tokens', 0) * 0.0015 + usage.get('completion_tokens', 0) * 0.002) / 1000
-                    self.log_message(f"OpenAI API usage - Prompt: {usage.get('prompt_tokens', 0)}, Completion: {usage.get('completion_tokens', 0)}, Total: {usage.get('total_tokens', 0)}, Est. Cost: ${estimated_cost:.4f}")
+        except httpx.HTTPError as e:
+            error_msg = f"Network error calling OpenAI API: {e}"
+            self.log_message(error_msg, "ERROR")
+            return f"• AI summary failed due to network error: {e}"
+        except Exception as e:
+            error_msg = f"Error calling OpenAI API: {e}"
+            self.log_message(error_msg, "ERROR")
+            return f"• AI summary failed: {e}"
 
-                # Count actual bullet points generated
-                bullet_count = len([line for line in summary.split('\n') if line.strip().startswith('•')])
-                self.log_message(f"Generated {bullet_count} bullet points")
+    async def agenerate_bullet_summary(self, client: 'httpx.AsyncClient', semaphore: asyncio.Semaphore,
+                                       commits: List[Dict], analysis: Dict) -> str:
+        """Async version of generate_bullet_summary sharing an httpx client and a concurrency limit."""
+        if not commits:
+            return "• No commits found in the specified time period by you."
+
+        chunks = self.chunk_commits_by_tokens(commits)
+        if len(chunks) > 1:
+            return await self.asummarize_chunks(client, semaphore, chunks, analysis)
+
+        self.log_message(f"AI Configuration: Model={self.AI_MODEL}, MaxTokens={self.MAX_TOKENS}, MaxBullets={self.MAX_BULLET_POINTS}, MaxWords={self.MAX_WORDS_PER_BULLET}")
+        return await self.apost_summary(client, semaphore, self.build_summary_payload(commits, analysis))
+
+    async def asummarize_chunks(self, client: 'httpx.AsyncClient', semaphore: asyncio.Semaphore,
+                                chunks: List[List[Dict]], analysis: Dict) -> str:
+        """Summarize each chunk of a large window concurrently, then merge the partial summaries."""
+        self.log_message(f"Window too large for one request, summarizing {sum(map(len, chunks))} commits in {len(chunks)} chunks")
+
+        partial_summaries = await asyncio.gather(*[
+            self.agenerate_bullet_summary(client, semaphore, chunk, self.analyze_my_commits(chunk))
+            for chunk in chunks
+        ])
 
+        # A failed chunk would leave a hole in the merged summary, so report the failure instead
+        for summary in partial_summaries:
+            if summary.startswith("• AI summary failed"):
                 return summary
-            else:
-                error_msg = f"OpenAI API Error {response.status_code}: {response.text}"
-                self.log_message(error_msg, "ERROR")
-                return f"• AI summary failed: {error_msg}"
 
-        except requests.exceptions.RequestException as e:
+        self.log_message(f"Merging {len(chunks)} partial summaries")
+        return await self.apost_summary(client, semaphore, self.build_reduce_payload(partial_summaries, analysis))
+
+    async def asend_completion(self, client: 'httpx.AsyncClient', semaphore: asyncio.Semaphore,
+                               payload: Dict, estimated_tokens: int) -> 'httpx.Response':
+        """POST a chat completion once through the async client, after waiting for rate limit budget."""
+        async with semaphore:
+            waited = await asyncio.to_thread(self.token_bucket.consume, estimated_tokens)
+            if waited:
+                self.log_message(f"Waited {waited:.1f}s for OpenAI rate limit budget")
+            return await client.post(self.openai_url, json=payload)
+
+    async def apost_summary(self, client: 'httpx.AsyncClient', semaphore: asyncio.Semaphore, payload: Dict) -> str:
+        """POST a summary payload through the shared async client and return the summary or an error line.
+
+        Network errors and 429/5xx responses are retried like post_completion; the
+        concurrency slot is given back while waiting to retry.
+        """
+        import httpx
+        from tenacity import AsyncRetrying
+
+        try:
+            estimated_tokens = self.estimate_tokens(payload)
+
+            retrying = AsyncRetrying(**self.retry_options())
+            response = await retrying(self.asend_completion, client, semaphore, payload, estimated_tokens)
+
+            result = response.json() if response.status_code == 200 else None
+            self.reconcile_usage(estimated_tokens, result)
+            return self.handle_summary_response(response.status_code, result, response.text)
+
+        except httpx.HTTPError as e:
             error_msg = f"Network error calling OpenAI API: {e}"
             self.log_message(error_msg, "ERROR")
             return f"• AI summary failed due to network error: {e}"
@@ -383,16 +1316,163 @@ Keep it simple, direct, and factual. Avoid superlatives and promotional language
             self.log_message(error_msg, "ERROR")
             return f"• AI summary failed: {e}"
 
+    async def agenerate_bullet_summaries(self, commit_windows: List[Tuple[List[Dict], Dict]],
+                                         max_concurrent: int = 5) -> List[str]:
+        """Summarize several (commits, analysis) windows concurrently, in input order."""
+        import httpx
+
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        limits = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+        async with httpx.AsyncClient(http2=import_optional('h2') is not None, timeout=60, limits=limits,
+                                     headers=self.api_headers()) as client:
+            return await asyncio.gather(*[
+                self.agenerate_bullet_summary(client, semaphore, commits, analysis)
+                for commits, analysis in commit_windows
+            ])
+
+    def generate_bullet_summaries(self, commit_windows: List[Tuple[List[Dict], Dict]],
+                                  max_concurrent: int = 5) -> List[str]:
+        """Summarize several (commits, analysis) windows, overlapping the OpenAI round-trips."""
+        return asyncio.run(self.agenerate_bullet_summaries(commit_windows, max_concurrent))
+
+    def build_batch_summary_payload(self, details: List[str]) -> Dict:
+        """Build one chat completion payload that asks for a summary of every window in details."""
+        instructions = (
+            f"Analyze each of the following {len(details)} windows of git commits from an Android Kotlin project "
+            "and provide a CONCISE HIGH-LEVEL WORK SUMMARY for each window.\n\n"
+            f"{self.summary_guidelines}\n\n"
+            "Start the summary for each window with a line of the form '### SUMMARY <n> ###', "
+            "where <n> is the number of the matching '### WINDOW <n> ###' message."
+        )
+
+        messages = [
+            {
+                'role': 'system',
+                'content': self.batch_system_prompt
+            },
+            {
+                'role': 'user',
+                'content': instructions
+            }
+        ]
+        for i, window_details in enumerate(details, 1):
+            messages.append({'role': 'user', 'content': f"### WINDOW {i} ###\n{window_details}"})
+
+        return {
+            'model': self.AI_MODEL,
+            'messages': messages,
+            'temperature': self.AI_TEMPERATURE,
+            'max_tokens': self.MAX_TOKENS * len(details)
+        }
+
+    def generate_bullet_summary_batch(self, commit_windows: List[Tuple[List[Dict], Dict]]) -> List[str]:
+        """Summarize several (commits, analysis) windows with as few OpenAI requests as possible.
+
+        Each request carries the shared instructions once for a batch of windows, and the
+        response is split on '### SUMMARY <n> ###' markers. A batch holds as many windows
+        as fit in MAX_COMPLETION_TOKENS, and batches are sent side by side. Windows whose
+        batch is rejected or answered without one section per window fall back to
+        generate_bullet_summaries.
+        """
+        summaries = ["• No commits found in the specified time period by you."] * len(commit_windows)
+        active = [i for i, (commits, _) in enumerate(commit_windows) if commits]
+        if len(active) <= 1:
+            return [self.generate_bullet_summary(commits, analysis) for commits, analysis in commit_windows]
+
+        # A window that needs chunking cannot share one request, so summarize windows separately
+        if any(len(self.chunk_commits_by_tokens(commit_windows[i][0])) > 1 for i in active):
+            return self.generate_bullet_summaries(commit_windows)
+
+        # Each window gets MAX_TOKENS of the reply, which must fit in the model's completion limit
+        batch_size = max(1, self.MAX_COMPLETION_TOKENS // self.MAX_TOKENS)
+        batches = [active[start:start + batch_size] for start in range(0, len(active), batch_size)]
+
+        # A lone window gains nothing from the batch format
+        separate = [i for batch in batches if len(batch) == 1 for i in batch]
+        batches = [batch for batch in batches if len(batch) > 1]
+
+        with ThreadPoolExecutor(max_workers=max(1, len(batches))) as executor:
+            batch_results = list(executor.map(
+                lambda batch: self.request_summary_batch([commit_windows[i] for i in batch]), batches
+            ))
+
+        for batch, batch_summaries in zip(batches, batch_results):
+            if batch_summaries is None:
+                separate.extend(batch)
+                continue
+            for i, summary in zip(batch, batch_summaries):
+                summaries[i] = summary
+
+        if separate:
+            separate.sort()
+            for i, summary in zip(separate, self.generate_bullet_summaries([commit_windows[i] for i in separate])):
+                summaries[i] = summary
+        return summaries
+
+    def request_summary_batch(self, commit_windows: List[Tuple[List[Dict], Dict]]) -> Optional[List[str]]:
+        """Summarize a batch of non-empty windows with one OpenAI request.
+
+        Returns one summary per window, the same failure line for every window if the
+        request failed, or None if the windows should be summarized separately instead:
+        the request was rejected (a non-retryable 4xx) or the reply did not have one
+        section per window.
+        """
+        import httpx
+
+        self.log_message(f"AI Configuration: Model={self.AI_MODEL}, MaxTokens={self.MAX_TOKENS * len(commit_windows)}, MaxBullets={self.MAX_BULLET_POINTS}, MaxWords={self.MAX_WORDS_PER_BULLET}, Windows={len(commit_windows)}")
+
+        try:
+            payload = self.build_batch_summary_payload(
+                [self.build_window_details(commits, analysis) for commits, analysis in commit_windows]
+            )
+
+            response = self.post_completion(payload)
+
+            result = response.json() if response.status_code == 200 else None
+            content = self.handle_summary_response(response.status_code, result, response.text)
+
+        except httpx.HTTPError as e:
+            error_msg = f"Network error calling OpenAI API: {e}"
+            self.log_message(error_msg, "ERROR")
+            return [f"• AI summary failed due to network error: {e}"] * len(commit_windows)
+        except Exception as e:
+            error_msg = f"Error calling OpenAI API: {e}"
+            self.log_message(error_msg, "ERROR")
+            return [f"• AI summary failed: {e}"] * len(commit_windows)
+
+        if response.status_code != 200:
+            if 400 <= response.status_code < 500 and response.status_code not in self.RETRYABLE_STATUS_CODES:
+                self.log_message("Batched summary request was rejected, summarizing windows separately", "WARNING")
+                return None
+            return [content] * len(commit_windows)
+
+        # re.split with a capture group gives ['<preamble>', '1', '<summary 1>', '2', '<summary 2>', ...]
+        sections = re.split(r'^\s*### SUMMARY (\d+) ###\s*$', content, flags=re.MULTILINE)
+        by_number = {int(number): text.strip() for number, text in zip(sections[1::2], sections[2::2])}
+
+        if set(by_number) != set(range(1, len(commit_windows) + 1)):
+            self.log_message("Batched summary did not contain one section per window, summarizing windows separately", "WARNING")
+            return None
+
+        return [by_number[number] for number in range(1, len(commit_windows) + 1)]
+
     def generate_report(self, commits: List[Dict], analysis: Dict, ai_summary: str, hours_back: int) -> str:
         """Generate a concise report focused on high-level business accomplishments."""
+        parts = self.build_report_parts(commits, analysis, hours_back)
+        parts[self.REPORT_SUMMARY_SLOT] = ai_summary
+        return ''.join(parts)
+
+    def build_report_parts(self, commits: List[Dict], analysis: Dict, hours_back: int) -> List[Optional[str]]:
+        """Build every section of the report except the AI summary, which goes in parts[REPORT_SUMMARY_SLOT].
+
+        Nothing here depends on the summary, so it can be built while the summary is still streaming.
+        """
         user_info = self.get_git_user_info()
         timestamp = self.get_ist_time()
 
-        # Count actual commits processed vs total found
-        total_found = len(commits) if len(commits) <= self.MAX_COMMITS_TO_ANALYZE else f"{len(commits)}+ (limited to {self.MAX_COMMITS_TO_ANALYZE})"
-
         # UPDATED: Report description reflects concise work focus
-        report = f"""# 📊 Work Summary - Development Activity
+        parts = [f"""# 📊 Work Summary - Development Activity
 
 **👤 Developer:** {user_info['name']} <{user_info['email']}>
 **🕐 Generated:** {timestamp} IST
@@ -407,26 +1487,24 @@ Keep it simple, direct, and factual. Avoid superlatives and promotional language
 
 ## ✅ Work Completed
 
-{ai_summary}
-
-"""
+""", None, "\n\n"]
 
         if commits:
-            report += "## 📝 Recent Commits\n"
+            parts.append("## 📝 Recent Commits\n")
             commits_to_show = min(len(commits), 5)
-            for i, commit in enumerate(commits[:commits_to_show], 1):
+            for i, commit in enumerate(islice(commits, commits_to_show), 1):
                 message = commit['message']
                 if len(message) > 60:
                     message = message[:57] + "..."
-                report += f"{i}. **[{commit['branch']}]** {message}\n"
+                parts.append(f"{i}. **[{commit['branch']}]** {message}\n")
             if len(commits) > commits_to_show:
-                report += f"   ... and {len(commits) - commits_to_show} more commits\n"
-            report += "\n"
+                parts.append(f"   ... and {len(commits) - commits_to_show} more commits\n")
+            parts.append("\n")
 
-        report += f"---\n*Generated at {timestamp} IST*\n"
-        report += f"*Log file: {self.log_file}*"
+        parts.append(f"---\n*Generated at {timestamp} IST*\n")
+        parts.append(f"*Log file: {self.log_file}*")
 
-        return report
+        return parts
 
     def save_report(self, report: str, filename: Optional[str] = None) -> str:
         """Save the report to a file."""
@@ -469,12 +1547,15 @@ Keep it simple, direct, and factual. Avoid superlatives and promotional language
         analysis = self.analyze_my_commits(commits)
         self.log_message(f"📊 Analysis: {analysis['total_commits']} commits, {analysis['kotlin_files']} Kotlin files, {len(analysis['branches'])} branches")
 
-        # Generate AI bullet summary
+        # Stream the AI bullet summary on a worker thread while the rest of the report is built
         self.log_message("🤖 Generating work summary...")
-        ai_summary = self.generate_bullet_summary(commits, analysis)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            summary_future = executor.submit(self.generate_bullet_summary, commits, analysis, True)
+            parts = self.build_report_parts(commits, analysis, hours_back)
+            parts[self.REPORT_SUMMARY_SLOT] = summary_future.result()
 
         # Generate report
-        report = self.generate_report(commits, analysis, ai_summary, hours_back)
+        report = ''.join(parts)
 
         # Save report
         if save_to_file:
@@ -487,9 +1568,78 @@ Keep it simple, direct, and factual. Avoid superlatives and promotional language
 
         return report
 
-def schedule_for_2_30_am():
-    """Schedule the script to run at 2:30 AM IST."""
-    ist = pytz.timezone('Asia/Kolkata')
+    async def run_analysis_async(self, hours_windows: List[int], save_to_file: bool = True,
+                                 verbose: bool = True) -> List[str]:
+        """Run the analysis for several look-back windows and return one report per window.
+
+        The windows are nested, so commits are collected once for the widest window and
+        each window keeps those committed within it. The summaries are then requested
+        by generate_bullet_summary_batch, several windows to a request.
+        """
+        if verbose:
+            self.log_message("🚀 Work Summarizer - Development Activity Analysis")
+            self.log_message("=" * 60)
+
+        if not self.check_git_repository():
+            error_msg = "❌ Error: Not in a git repository. Please run from your project root."
+            self.log_message(error_msg, "ERROR")
+            return [error_msg] * len(hours_windows)
+
+        widest_hours = max(hours_windows)
+        self.log_message(f"🔍 Analyzing work from the last {widest_hours} hours across all branches...")
+        all_commits = await asyncio.to_thread(self.collect_my_commits, widest_hours)
+
+        # Filter on the committer timestamp, as git log --since does
+        now = time.time()
+        commit_windows = []
+        for hours_back in hours_windows:
+            since_timestamp = now - hours_back * 3600
+            commits = self.limit_commits([commit for commit in all_commits if commit['commit_time'] >= since_timestamp])
+            analysis = self.analyze_my_commits(commits)
+            commit_windows.append((commits, analysis))
+
+        self.log_message(f"🤖 Generating work summaries for {len(hours_windows)} windows...")
+        ai_summaries = await asyncio.to_thread(self.generate_bullet_summary_batch, commit_windows)
+
+        reports = []
+        for hours_back, (commits, analysis), ai_summary in zip(hours_windows, commit_windows, ai_summaries):
+            if not commits:
+                no_commits_msg = f"No development activity found in the last {hours_back} hours across any branch."
+                self.log_message(no_commits_msg, "INFO")
+                reports.append(no_commits_msg)
+                continue
+
+            report = self.generate_report(commits, analysis, ai_summary, hours_back)
+
+            # Reports for several windows are saved in the same second, so name them by window
+            if save_to_file:
+                self.save_report(report, f"work_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{hours_back}h.md")
+
+            reports.append(report)
+
+        self.log_message("✅ Analysis completed!")
+        self.log_message(f"📄 Log file: {self.log_file}")
+
+        return reports
+
+def run_windows(summarizer: GitCommitSummarizer, hours_windows: List[int],
+                save_to_file: bool = True, verbose: bool = True) -> List[str]:
+    """Run the analysis for each look-back window; several windows are summarized in batched requests."""
+    if len(hours_windows) > 1:
+        return asyncio.run(summarizer.run_analysis_async(hours_windows, save_to_file=save_to_file, verbose=verbose))
+    return [summarizer.run_analysis(hours_back=hours_windows[0], save_to_file=save_to_file, verbose=verbose)]
+
+def schedule_for_2_30_am(summarizer_options: Optional[Dict] = None, hours_windows: Optional[List[int]] = None,
+                         save_to_file: bool = True, verbose: bool = True):
+    """Schedule the script to run at 2:30 AM IST.
+
+    summarizer_options are passed to GitCommitSummarizer once the wait is over; the
+    API key is checked up front so a missing key fails now rather than at 2:30 AM.
+    """
+    summarizer_options = summarizer_options or {}
+    GitCommitSummarizer.resolve_api_key(summarizer_options.get('api_key'))
+
+    ist = ZoneInfo('Asia/Kolkata')
     now = datetime.now(ist)
 
     # Calculate next 2:30 AM
@@ -507,44 +1657,86 @@ def schedule_for_2_30_am():
     time.sleep(wait_seconds)
 
     # Run the analysis
-    summarizer = GitCommitSummarizer()
-    report = summarizer.run_analysis()
-    print("\n" + "=" * 60)
-    print(report)
+    with GitCommitSummarizer(**summarizer_options) as summarizer:
+        reports = run_windows(summarizer, hours_windows or [24], save_to_file, verbose)
+
+    for report in reports:
+        print("\n" + "=" * 60)
+        print(report)
+
+def build_cron_entry(args: argparse.Namespace) -> str:
+    """Build a crontab entry that runs the script with the parsed options daily at 2:30 AM IST.
+
+    Unlike --schedule, nothing stays resident between runs. The command line is rebuilt
+    from the parsed options rather than copied from argv, where argparse also accepts
+    abbreviations: only the analysis options are passed on, never --schedule, --cron or
+    --api-key, so the key doesn't end up in the crontab.
+    """
+    options = ['--hours'] + [str(hours) for hours in args.hours]
+    if args.no_save:
+        options.append('--no-save')
+    if args.quiet:
+        options.append('--quiet')
+    if args.raw_prompt:
+        options.append('--raw-prompt')
+    if args.rpm:
+        options.extend(['--rpm', str(args.rpm)])
+    if args.tpm:
+        options.extend(['--tpm', str(args.tpm)])
+
+    # cron runs in the machine's local time zone, so convert 2:30 AM IST to it
+    run_time = datetime.now(ZoneInfo('Asia/Kolkata')).replace(hour=2, minute=30, second=0, microsecond=0).astimezone()
+
+    command = ' '.join(shlex.quote(part) for part in
+                       [sys.executable, os.path.abspath(__file__)] + options)
+    return (f"# Daily at 2:30 AM IST ({run_time.strftime('%H:%M %Z')} local time)\n"
+            "# cron does not read your shell profile, so set OPENAI_API_KEY=... at the top of the crontab\n"
+            f"{run_time.minute} {run_time.hour} * * * cd {shlex.quote(os.getcwd())} && {command}")
 
 def main():
     """Main function with command line argument parsing."""
     parser = argparse.ArgumentParser(description='Work Summarizer - Concise development activity analysis')
-    parser.add_argument('--hours', type=int, default=24, help='Hours back to analyze (default: 24)')
+    parser.add_argument('--hours', type=int, nargs='+', default=[24], help='Hours back to analyze; several values produce one report per window (default: 24)')
     parser.add_argument('--no-save', action='store_true', help='Don\'t save report to file')
     parser.add_argument('--quiet', action='store_true', help='Quiet mode - minimal output')
     parser.add_argument('--schedule', action='store_true', help='Schedule to run at 2:30 AM IST')
+    parser.add_argument('--cron', action='store_true', help='Print a crontab entry that runs with these options daily at 2:30 AM IST, then exit')
     parser.add_argument('--api-key', type=str, help='OpenAI API key (overrides environment variable)')
+    parser.add_argument('--raw-prompt', action='store_true', help='Send individual commit messages to the AI instead of grouped work areas')
+    parser.add_argument('--rpm', type=int, help=f'OpenAI requests per minute to pace against (default: {GitCommitSummarizer.MAX_REQUESTS_PER_MINUTE})')
+    parser.add_argument('--tpm', type=int, help=f'OpenAI tokens per minute to pace against (default: {GitCommitSummarizer.MAX_TOKENS_PER_MINUTE})')
 
     args = parser.parse_args()
 
-    # Handle scheduling
-    if args.schedule:
-        schedule_for_2_30_am()
+    summarizer_options = {
+        'api_key': args.api_key,
+        'raw_prompt': args.raw_prompt,
+        'requests_per_minute': args.rpm,
+        'tokens_per_minute': args.tpm
+    }
+
+    # cron runs the script only when it is due, instead of a process waiting all day
+    if args.cron:
+        print(build_cron_entry(args))
         return
 
     try:
-        # Create summarizer
-        summarizer = GitCommitSummarizer(api_key=args.api_key)
-
-        # Run analysis
-        report = summarizer.run_analysis(
-            hours_back=args.hours,
-            save_to_file=not args.no_save,
-            verbose=not args.quiet
-        )
+        # Handle scheduling
+        if args.schedule:
+            schedule_for_2_30_am(summarizer_options, args.hours, save_to_file=not args.no_save, verbose=not args.quiet)
+            return
+
+        # Create summarizer and run analysis; several windows share batched OpenAI requests
+        with GitCommitSummarizer(**summarizer_options) as summarizer:
+            reports = run_windows(summarizer, args.hours, save_to_file=not args.no_save, verbose=not args.quiet)
 
         # Print report if not in quiet mode
         if not args.quiet:
-            print("\n" + "=" * 60)
-            print("📄 WORK SUMMARY:")
-            print("=" * 60)
-            print(report)
+            for report in reports:
+                print("\n" + "=" * 60)
+                print("📄 WORK SUMMARY:")
+                print("=" * 60)
+                print(report)
 
     except ValueError as e:
         print(f"❌ Configuration Error: {e}")